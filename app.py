@@ -1,16 +1,50 @@
 import os
+import random
+import threading
+import time
 import boto3
-from flask import Flask, request, jsonify
-from decimal import Decimal
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.types import DYNAMODB_CONTEXT
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import orjson
+from cachetools import TTLCache
+from flask import Flask, request
+from flask_compress import Compress
+from decimal import Decimal, DecimalException, Inexact, InvalidOperation, Rounded
+from datetime import datetime, timezone
 import uuid
 
 app = Flask(__name__)
+# /productos y /productos/ resuelven a la misma ruta sin redirección
+app.url_map.strict_slashes = False
+
+# Comprimir respuestas JSON grandes (brotli si el cliente lo acepta, si no gzip)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
 
 # Configuración desde variables de entorno
 ENVIRONMENT = os.getenv('ENVIRONMENT', 'local')
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 TABLE_NAME = os.getenv('TABLE_NAME', f"productos_{ENVIRONMENT}")
+SCAN_SEGMENTS = int(os.getenv('SCAN_SEGMENTS', '4'))
+if SCAN_SEGMENTS < 1:
+    raise ValueError(f'SCAN_SEGMENTS debe ser un entero mayor o igual a 1 (recibido: {SCAN_SEGMENTS})')
+# Hilos por worker de gunicorn (misma variable que gunicorn.conf.py)
+GUNICORN_THREADS = int(os.getenv('GUNICORN_THREADS') or 16)
+HEALTH_CACHE_TTL = 5  # segundos
+DAX_ENDPOINT = os.getenv('DAX_ENDPOINT')
+ITEM_CACHE_SIZE = 10000
+ITEM_CACHE_TTL = 60  # segundos
+MAX_BULK_ITEMS = 100  # límite de BatchGetItem por llamada
+BULK_GET_MAX_ATTEMPTS = 5
+BULK_GET_BACKOFF_BASE = 0.05  # segundos
+BULK_GET_BACKOFF_MAX = 1  # segundos
+MAX_PAGE_SIZE = 1000
+# Atributos que devuelve el listado en modo resumen (sin descripcion ni timestamps)
+RESUMEN_PROJECTION = 'id, nombre, precio, stock'
 
 # Configurar cliente DynamoDB
 dynamodb_config = {
@@ -26,28 +60,189 @@ if os.getenv('AWS_ACCESS_KEY_ID') and os.getenv('AWS_SECRET_ACCESS_KEY'):
     if os.getenv('AWS_SESSION_TOKEN'):
         dynamodb_config['aws_session_token'] = os.getenv('AWS_SESSION_TOKEN')
 
-dynamodb = boto3.resource('dynamodb', **dynamodb_config)
-table = dynamodb.Table(TABLE_NAME)
+# Reutilizar conexiones HTTP (keep-alive) entre requests para evitar el handshake TLS en cada llamada
+# Cada hilo puede tener hasta SCAN_SEGMENTS llamadas en curso (escaneo paralelo de GET /productos);
+# con menos conexiones en el pool urllib3 descarta las sobrantes y se pierde el keep-alive
+dynamodb_client_config = Config(
+    max_pool_connections=GUNICORN_THREADS * SCAN_SEGMENTS,
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=3,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+dynamodb = boto3.resource('dynamodb', **dynamodb_config, config=dynamodb_client_config)
+
+# Resource y tabla para operaciones de datos; se crean en el primer uso (ver get_data_resource)
+_data_source = {'resource': None, 'table': None}
+_data_lock = threading.Lock()
+
+# Contexto de DynamoDB (38 dígitos, exponente acotado) que redondea en lugar de fallar;
+# sigue lanzando excepción para valores fuera de rango
+_PRECIO_CONTEXT = DYNAMODB_CONTEXT.copy()
+_PRECIO_CONTEXT.traps[Inexact] = False
+_PRECIO_CONTEXT.traps[Rounded] = False
+
+# Último resultado del health check de DynamoDB (error=None significa conectado)
+_health_cache = {'ts': float('-inf'), 'error': None}
+_health_lock = threading.Lock()
+
+# Caché en memoria de productos individuales, por proceso
+_item_cache = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL)
+# Contador de invalidaciones: un GET que leyó de DynamoDB antes de un PUT/DELETE
+# no debe guardar su copia en la caché después de la invalidación
+_cache_state = {'invalidations': 0}
+_cache_lock = threading.Lock()
 
-def decimal_default(obj):
-    """Helper para serializar Decimal a JSON"""
+def orjson_default(obj):
+    """Helper de orjson para serializar Decimal durante la codificación"""
     if isinstance(obj, Decimal):
         return float(obj)
     raise TypeError
 
-def convert_decimals(obj):
-    """Convierte Decimals a float recursivamente"""
-    if isinstance(obj, list):
-        return [convert_decimals(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: convert_decimals(value) for key, value in obj.items()}
-    elif isinstance(obj, Decimal):
-        return float(obj)
-    return obj
+def ojsonify(payload, status=200):
+    """Construye una respuesta JSON serializada con orjson"""
+    return app.response_class(
+        orjson.dumps(payload, default=orjson_default),
+        status=status,
+        mimetype='application/json'
+    )
+
+def get_data_resource():
+    """Resource para operaciones de datos: DAX si DAX_ENDPOINT está configurado, si no DynamoDB"""
+    # El cliente DAX abre sockets e hilos de refresco al crearse, así que no puede construirse
+    # al importar el módulo (con preload_app se heredarían en todos los workers de gunicorn).
+    # Las operaciones de control (describe_table en el health check) siguen yendo a DynamoDB.
+    if _data_source['resource'] is None:
+        with _data_lock:
+            if _data_source['resource'] is None:
+                if DAX_ENDPOINT:
+                    from amazondax import AmazonDaxClient
+                    resource = AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT, **dynamodb_config)
+                else:
+                    resource = dynamodb
+                _data_source['table'] = resource.Table(TABLE_NAME)
+                _data_source['resource'] = resource
+    return _data_source['resource']
+
+def get_table():
+    """Tabla de productos sobre el resource de get_data_resource()"""
+    get_data_resource()
+    return _data_source['table']
+
+def scan_segment(segment, base_kwargs):
+    """Escanea un segmento de la tabla siguiendo la paginación de DynamoDB"""
+    items = []
+    scan_kwargs = dict(base_kwargs, Segment=segment, TotalSegments=SCAN_SEGMENTS)
+    while True:
+        response = get_table().scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def read_json_body():
+    """Parsea el body con orjson; devuelve (data, None) o (None, respuesta de error)"""
+    if not request.is_json:
+        return None, ojsonify({'error': 'El Content-Type debe ser application/json'}, 415)
+    try:
+        return orjson.loads(request.get_data(cache=False) or b'{}'), None
+    except orjson.JSONDecodeError:
+        return None, ojsonify({'error': 'El body no es un JSON válido'}, 400)
+
+def parse_precio(valor):
+    """Valida el precio y lo convierte a Decimal; lanza ValueError si es inválido"""
+    # Un solo parseo a Decimal; los float pasan por su repr corto para no guardar la expansión binaria
+    try:
+        precio = Decimal(valor if isinstance(valor, (int, str)) else str(valor))
+    except (InvalidOperation, ValueError, TypeError):
+        raise ValueError('El precio debe ser un número válido')
+    if not precio.is_finite():
+        raise ValueError('El precio debe ser un número válido')
+    # Ajustar a lo que DynamoDB puede guardar: redondea a 38 dígitos y rechaza valores fuera de rango
+    try:
+        precio = _PRECIO_CONTEXT.create_decimal(precio)
+    except DecimalException:
+        raise ValueError('El precio debe ser un número válido')
+    if precio < 0:
+        raise ValueError('El precio no puede ser negativo')
+    return precio
+
+def parse_texto(valor, campo):
+    """Valida que un campo de texto sea string y le quita espacios; lanza ValueError si es inválido"""
+    if not isinstance(valor, str):
+        raise ValueError(f'{campo} debe ser un texto')
+    return valor.strip()
+
+def parse_stock(valor):
+    """Valida el stock y lo convierte a int; lanza ValueError si es inválido"""
+    try:
+        return int(valor)
+    except (ValueError, TypeError):
+        raise ValueError('El stock debe ser un número entero')
+
+def now_iso():
+    """Timestamp actual en formato ISO 8601 (UTC)"""
+    return datetime.now(timezone.utc).isoformat()
+
+def build_producto(data, timestamp):
+    """Valida el body de un producto nuevo y construye el item; lanza ValueError si es inválido"""
+    # Validaciones básicas
+    if not isinstance(data, dict) or 'nombre' not in data or 'precio' not in data:
+        raise ValueError('nombre y precio son campos requeridos')
+    
+    precio = parse_precio(data['precio'])
+    
+    return {
+        'id': str(uuid.uuid4()),
+        'nombre': parse_texto(data['nombre'], 'nombre'),
+        'precio': precio,
+        'descripcion': parse_texto(data.get('descripcion', ''), 'descripcion'),
+        'stock': parse_stock(data.get('stock', 0)),
+        'created_at': timestamp,
+        'updated_at': timestamp
+    }
+
+# Campos actualizables: (campo, fragmento de UpdateExpression, placeholder, conversión)
+_UPDATE_FIELDS = (
+    ('nombre', 'nombre = :nombre', ':nombre', lambda valor: parse_texto(valor, 'nombre')),
+    ('precio', 'precio = :precio', ':precio', parse_precio),
+    ('descripcion', 'descripcion = :descripcion', ':descripcion', lambda valor: parse_texto(valor, 'descripcion')),
+    ('stock', 'stock = :stock', ':stock', parse_stock)
+)
+
+def invalidate_cached_producto(producto_id):
+    """Saca un producto de la caché tras escribirlo y descarta los llenados en curso"""
+    with _cache_lock:
+        _item_cache.pop(producto_id, None)
+        _cache_state['invalidations'] += 1
+
+def is_conditional_check_failed(error):
+    """Indica si un ClientError proviene de una ConditionExpression no cumplida"""
+    return error.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
+
+def check_dynamodb():
+    """Verifica la conexión a DynamoDB, reutilizando el resultado durante HEALTH_CACHE_TTL segundos"""
+    if time.monotonic() - _health_cache['ts'] < HEALTH_CACHE_TTL:
+        return _health_cache['error']
+    with _health_lock:
+        if time.monotonic() - _health_cache['ts'] >= HEALTH_CACHE_TTL:
+            try:
+                dynamodb.meta.client.describe_table(TableName=TABLE_NAME)
+                _health_cache['error'] = None
+            except Exception as e:
+                _health_cache['error'] = str(e)
+            _health_cache['ts'] = time.monotonic()
+    return _health_cache['error']
+
+@app.errorhandler(404)
+def not_found(error):
+    """Respuesta JSON para rutas inexistentes o ids que no son UUID"""
+    return ojsonify({'error': 'Recurso no encontrado'}, 404)
 
 @app.route('/')
 def home():
-    return jsonify({
+    return ojsonify({
         'message': 'API de Productos - Práctica 5 CI/CD',
         'environment': ENVIRONMENT,
         'table': TABLE_NAME,
@@ -55,32 +250,33 @@ def home():
         'endpoints': {
             'health': '/health',
             'create': 'POST /productos',
-            'list': 'GET /productos',
+            'list': 'GET /productos?resumen=true&limit=<n>&cursor=<id>',
             'get': 'GET /productos/<id>',
             'update': 'PUT /productos/<id>',
-            'delete': 'DELETE /productos/<id>'
+            'delete': 'DELETE /productos/<id>',
+            'bulk_create': 'POST /productos/bulk',
+            'bulk_get': 'GET /productos/bulk?ids=<id1>,<id2>'
         }
     })
 
 @app.route('/health')
 def health():
     """Endpoint de health check"""
-    try:
-        # Verificar conexión a DynamoDB
-        table.table_status
-        return jsonify({
-            'status': 'healthy',
-            'environment': ENVIRONMENT,
-            'table': TABLE_NAME,
-            'database': 'connected',
-            'region': AWS_REGION
-        }), 200
-    except Exception as e:
-        return jsonify({
+    # Verificar conexión a DynamoDB
+    error = check_dynamodb()
+    if error is not None:
+        return ojsonify({
             'status': 'unhealthy',
             'environment': ENVIRONMENT,
-            'error': str(e)
-        }), 503
+            'error': error
+        }, 503)
+    return ojsonify({
+        'status': 'healthy',
+        'environment': ENVIRONMENT,
+        'table': TABLE_NAME,
+        'database': 'connected',
+        'region': AWS_REGION
+    })
 
 # CREATE - Crear un producto
 @app.route('/productos', methods=['POST'])
@@ -95,86 +291,194 @@ def create_producto():
     }
     """
     try:
-        data = request.get_json()
-        
-        # Validaciones básicas
-        if not data or 'nombre' not in data or 'precio' not in data:
-            return jsonify({'error': 'nombre y precio son campos requeridos'}), 400
+        data, error = read_json_body()
+        if error is not None:
+            return error
         
-        # Validar que precio sea numérico
         try:
-            precio = float(data['precio'])
-            if precio < 0:
-                return jsonify({'error': 'El precio no puede ser negativo'}), 400
-        except (ValueError, TypeError):
-            return jsonify({'error': 'El precio debe ser un número válido'}), 400
-        
-        producto_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat()
-        
-        item = {
-            'id': producto_id,
-            'nombre': data['nombre'].strip(),
-            'precio': Decimal(str(precio)),
-            'descripcion': data.get('descripcion', '').strip(),
-            'stock': int(data.get('stock', 0)),
-            'created_at': timestamp,
-            'updated_at': timestamp
-        }
-        
-        table.put_item(Item=item)
+            item = build_producto(data, now_iso())
+        except ValueError as e:
+            return ojsonify({'error': str(e)}, 400)
         
-        # Convertir Decimals para la respuesta JSON
-        response_item = convert_decimals(item)
+        get_table().put_item(Item=item)
         
-        return jsonify({
+        return ojsonify({
             'message': 'Producto creado exitosamente',
-            'producto': response_item
-        }), 201
+            'producto': item
+        }, 201)
+    except Exception as e:
+        return ojsonify({'error': str(e)}, 500)
+
+# CREATE - Crear varios productos en lote
+@app.route('/productos/bulk', methods=['POST'])
+def create_productos_bulk():
+    """
+    Crear varios productos con BatchWriteItem (hasta 25 items por llamada a DynamoDB)
+    Body: {
+        "productos": [ {producto}, ... ] (mismo formato que POST /productos)
+    }
+    """
+    try:
+        data, error = read_json_body()
+        if error is not None:
+            return error
+        
+        if not isinstance(data, dict) or not isinstance(data.get('productos'), list) or not data['productos']:
+            return ojsonify({'error': 'productos debe ser una lista no vacía'}, 400)
+        
+        if len(data['productos']) > MAX_BULK_ITEMS:
+            return ojsonify({'error': f'Máximo {MAX_BULK_ITEMS} productos por lote'}, 400)
+        
+        # Validar todo el lote antes de escribir; todos comparten el mismo timestamp
+        timestamp = now_iso()
+        items = []
+        for i, producto in enumerate(data['productos']):
+            try:
+                items.append(build_producto(producto, timestamp))
+            except ValueError as e:
+                return ojsonify({'error': f'Producto {i}: {e}'}, 400)
+        
+        # batch_writer agrupa los puts y reintenta los UnprocessedItems
+        with get_table().batch_writer(overwrite_by_pkeys=['id']) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+        
+        return ojsonify({
+            'message': 'Productos creados exitosamente',
+            'count': len(items),
+            'productos': items
+        }, 201)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
+
+# READ - Obtener varios productos por ID
+@app.route('/productos/bulk', methods=['GET'])
+def get_productos_bulk():
+    """
+    Obtener varios productos con BatchGetItem
+    Query: ?ids=<id1>,<id2>,...
+    """
+    try:
+        # BatchGetItem rechaza claves duplicadas
+        ids = list(dict.fromkeys(i for i in request.args.get('ids', '').split(',') if i))
+        
+        if not ids:
+            return ojsonify({'error': 'ids es un parámetro requerido'}, 400)
+        
+        if len(ids) > MAX_BULK_ITEMS:
+            return ojsonify({'error': f'Máximo {MAX_BULK_ITEMS} ids por lote'}, 400)
+        
+        # Igual que en GET /productos/<id>, los ids que no son UUID no se consultan en DynamoDB
+        normalizados = {}
+        for producto_id in ids:
+            try:
+                normalizados[producto_id] = str(uuid.UUID(producto_id))
+            except ValueError:
+                pass
+        keys = [{'id': producto_id} for producto_id in dict.fromkeys(normalizados.values())]
+        
+        productos = []
+        request_items = {TABLE_NAME: {'Keys': keys}} if keys else None
+        attempt = 0
+        while request_items:
+            if attempt == BULK_GET_MAX_ATTEMPTS:
+                return ojsonify({'error': 'DynamoDB no pudo procesar todos los ids, intenta de nuevo'}, 503)
+            if attempt:
+                # UnprocessedKeys suele indicar throttling: esperar con backoff exponencial y jitter
+                time.sleep(random.uniform(0, min(BULK_GET_BACKOFF_MAX, BULK_GET_BACKOFF_BASE * 2 ** attempt)))
+            response = get_data_resource().batch_get_item(RequestItems=request_items)
+            productos.extend(response['Responses'].get(TABLE_NAME, []))
+            request_items = response.get('UnprocessedKeys')
+            attempt += 1
+        
+        encontrados = {producto['id'] for producto in productos}
+        
+        return ojsonify({
+            'count': len(productos),
+            'productos': productos,
+            'no_encontrados': [producto_id for producto_id in ids if normalizados.get(producto_id) not in encontrados]
+        })
+    except Exception as e:
+        return ojsonify({'error': str(e)}, 500)
 
 # READ - Obtener todos los productos
 @app.route('/productos', methods=['GET'])
 def get_productos():
     """
     Listar todos los productos
+    Query (opcional):
+        resumen=true  solo devuelve id, nombre, precio y stock
+        limit=N       devuelve una página de hasta N productos
+        cursor=<id>   continúa desde el next_cursor de la página anterior
     """
     try:
-        response = table.scan()
-        productos = response.get('Items', [])
+        scan_kwargs = {}
+        if request.args.get('resumen', '').lower() == 'true':
+            scan_kwargs['ProjectionExpression'] = RESUMEN_PROJECTION
+        
+        if 'limit' not in request.args:
+            # Escaneo paralelo por segmentos
+            with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+                segmentos = executor.map(lambda segment: scan_segment(segment, scan_kwargs), range(SCAN_SEGMENTS))
+                productos = [item for segmento in segmentos for item in segmento]
+            
+            return ojsonify({
+                'count': len(productos),
+                'productos': productos
+            })
+        
+        # Listado paginado
+        try:
+            limit = int(request.args['limit'])
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            return ojsonify({'error': f'limit debe ser un entero entre 1 y {MAX_PAGE_SIZE}'}, 400)
+        
+        scan_kwargs['Limit'] = limit
+        if request.args.get('cursor'):
+            scan_kwargs['ExclusiveStartKey'] = {'id': request.args['cursor']}
         
-        # Convertir Decimals para la respuesta JSON
-        productos = convert_decimals(productos)
+        response = get_table().scan(**scan_kwargs)
+        productos = response.get('Items', [])
         
-        return jsonify({
+        return ojsonify({
             'count': len(productos),
-            'productos': productos
-        }), 200
+            'productos': productos,
+            'next_cursor': response.get('LastEvaluatedKey', {}).get('id')
+        })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 # READ - Obtener un producto por ID
-@app.route('/productos/<string:producto_id>', methods=['GET'])
+@app.route('/productos/<uuid:producto_id>', methods=['GET'])
 def get_producto(producto_id):
     """
     Obtener un producto específico por ID
     """
+    producto_id = str(producto_id)
     try:
-        response = table.get_item(Key={'id': producto_id})
+        with _cache_lock:
+            producto = _item_cache.get(producto_id)
+            invalidations = _cache_state['invalidations']
+        if producto is not None:
+            return ojsonify(producto)
+        
+        response = get_table().get_item(Key={'id': producto_id})
         
         if 'Item' not in response:
-            return jsonify({'error': 'Producto no encontrado'}), 404
+            return ojsonify({'error': 'Producto no encontrado'}, 404)
         
-        # Convertir Decimals para la respuesta JSON
-        producto = convert_decimals(response['Item'])
+        with _cache_lock:
+            if _cache_state['invalidations'] == invalidations:
+                _item_cache[producto_id] = response['Item']
         
-        return jsonify(producto), 200
+        return ojsonify(response['Item'])
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 # UPDATE - Actualizar un producto
-@app.route('/productos/<string:producto_id>', methods=['PUT'])
+@app.route('/productos/<uuid:producto_id>', methods=['PUT'])
 def update_producto(producto_id):
     """
     Actualizar un producto existente
@@ -185,85 +489,90 @@ def update_producto(producto_id):
         "stock": "integer (opcional)"
     }
     """
+    producto_id = str(producto_id)
     try:
-        data = request.get_json()
+        data, error = read_json_body()
+        if error is not None:
+            return error
         
-        if not data:
-            return jsonify({'error': 'No hay datos para actualizar'}), 400
+        if not isinstance(data, dict):
+            return ojsonify({'error': 'El body debe ser un objeto JSON'}, 400)
         
-        # Verificar que el producto existe
-        response = table.get_item(Key={'id': producto_id})
-        if 'Item' not in response:
-            return jsonify({'error': 'Producto no encontrado'}), 404
+        if not data:
+            return ojsonify({'error': 'No hay datos para actualizar'}, 400)
         
         # Construir expresión de actualización
-        update_expression = "SET updated_at = :updated_at"
-        expression_values = {':updated_at': datetime.utcnow().isoformat()}
+        set_clauses = ['updated_at = :updated_at']
+        expression_values = {':updated_at': now_iso()}
         
-        if 'nombre' in data:
-            update_expression += ", nombre = :nombre"
-            expression_values[':nombre'] = data['nombre'].strip()
+        try:
+            for field, clause, placeholder, convert in _UPDATE_FIELDS:
+                if field in data:
+                    set_clauses.append(clause)
+                    expression_values[placeholder] = convert(data[field])
+        except ValueError as e:
+            return ojsonify({'error': str(e)}, 400)
         
-        if 'precio' in data:
-            try:
-                precio = float(data['precio'])
-                if precio < 0:
-                    return jsonify({'error': 'El precio no puede ser negativo'}), 400
-                update_expression += ", precio = :precio"
-                expression_values[':precio'] = Decimal(str(precio))
-            except (ValueError, TypeError):
-                return jsonify({'error': 'El precio debe ser un número válido'}), 400
-        
-        if 'descripcion' in data:
-            update_expression += ", descripcion = :descripcion"
-            expression_values[':descripcion'] = data['descripcion'].strip()
-        
-        if 'stock' in data:
-            update_expression += ", stock = :stock"
-            expression_values[':stock'] = int(data['stock'])
-        
-        response = table.update_item(
-            Key={'id': producto_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_values,
-            ReturnValues='ALL_NEW'
-        )
-        
-        # Convertir Decimals para la respuesta JSON
-        producto = convert_decimals(response['Attributes'])
-        
-        return jsonify({
+        update_expression = 'SET ' + ', '.join(set_clauses)
+        
+        # La condición verifica que el producto existe en la misma llamada
+        try:
+            response = get_table().update_item(
+                Key={'id': producto_id},
+                UpdateExpression=update_expression,
+                ExpressionAttributeValues=expression_values,
+                ConditionExpression=Attr('id').exists(),
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return ojsonify({'error': 'Producto no encontrado'}, 404)
+            raise
+        
+        invalidate_cached_producto(producto_id)
+        
+        return ojsonify({
             'message': 'Producto actualizado exitosamente',
-            'producto': producto
-        }), 200
+            'producto': response['Attributes']
+        })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 # DELETE - Eliminar un producto
-@app.route('/productos/<string:producto_id>', methods=['DELETE'])
+@app.route('/productos/<uuid:producto_id>', methods=['DELETE'])
 def delete_producto(producto_id):
     """
     Eliminar un producto por ID
     """
+    producto_id = str(producto_id)
     try:
-        # Verificar que el producto existe
-        response = table.get_item(Key={'id': producto_id})
-        if 'Item' not in response:
-            return jsonify({'error': 'Producto no encontrado'}), 404
+        # La condición verifica que el producto existe en la misma llamada
+        try:
+            get_table().delete_item(
+                Key={'id': producto_id},
+                ConditionExpression=Attr('id').exists()
+            )
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return ojsonify({'error': 'Producto no encontrado'}, 404)
+            raise
         
-        table.delete_item(Key={'id': producto_id})
+        invalidate_cached_producto(producto_id)
         
-        return jsonify({
+        return ojsonify({
             'message': 'Producto eliminado exitosamente',
             'id': producto_id
-        }), 200
+        })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5002))
-    debug = ENVIRONMENT == 'local'
     
+    if ENVIRONMENT != 'local':
+        print("El servidor de desarrollo solo se usa en local.")
+        print("En otros ambientes usa: gunicorn -c gunicorn.conf.py app:app")
+        raise SystemExit(1)
 
     print("Práctica 5 CI/CD ")
 
@@ -271,7 +580,6 @@ if __name__ == '__main__':
     print(f" Tabla DynamoDB: {TABLE_NAME}")
     print(f"Región AWS: {AWS_REGION}")
     print(f" Puerto: {port}")
-    print(f"Debug: {debug}")
     print("══════════════════════════════════════════════════════════════")
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    app.run(host='0.0.0.0', port=port, debug=True)
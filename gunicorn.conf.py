@@ -0,0 +1,27 @@
+"""
+Configuración de gunicorn para producción
+Uso: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5002')}"
+
+# CPUs asignados al proceso, no los del host (sched_getaffinity solo existe en Linux)
+if hasattr(os, 'sched_getaffinity'):
+    cpus = len(os.sched_getaffinity(0))
+else:
+    cpus = os.cpu_count() or 1
+
+# Workers con hilos: la app pasa la mayor parte del tiempo esperando a DynamoDB,
+# así que la concurrencia de I/O se ajusta subiendo GUNICORN_THREADS
+# (app.py dimensiona el pool de conexiones de boto3 como GUNICORN_THREADS * SCAN_SEGMENTS)
+workers = int(os.getenv('GUNICORN_WORKERS') or cpus * 2 + 1)
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS') or 16)
+
+keepalive = 30
+timeout = 120
+
+# Cargar app.py una vez en el proceso maestro y compartirlo con los workers
+preload_app = True
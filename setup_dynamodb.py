@@ -6,6 +6,7 @@ Script para crear las tablas de DynamoDB para la aplicación de productos
 import boto3
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def crear_tabla(dynamodb, table_name):
     """Crea una tabla de DynamoDB para productos"""
@@ -65,18 +66,17 @@ def main():
     # Crear tablas para ambos ambientes
     tablas = ['productos_local', 'productos_prod']
     
-    exito = True
-    for tabla in tablas:
-        if not crear_tabla(dynamodb, tabla):
-            exito = False
+    # Crear las tablas en paralelo; la espera de cada una es independiente
+    with ThreadPoolExecutor(max_workers=len(tablas)) as executor:
+        resultados = list(executor.map(lambda tabla: crear_tabla(dynamodb, tabla), tablas))
+    exito = all(resultados)
     
     if exito:
         print("\n Todas las tablas fueron creadas/verificadas correctamente")
         
         print("\n Tablas disponibles:")
-        tables = list(dynamodb.tables.all())
-        for table in tables:
-            print(f"  - {table.name}")
+        for tabla in tablas:
+            print(f"  - {tabla}")
         
         return 0
     else: